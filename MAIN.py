@@ -1,17 +1,22 @@
-import sys, os, json
-import pandas as pd
+import sys, os, csv, json, struct, threading, time
+import importlib.util
+import numpy as np
 import serial.tools.list_ports
 
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QPushButton, QLabel, QVBoxLayout, QHBoxLayout,
-    QLineEdit, QTableWidget, QTableWidgetItem, QStackedWidget, QMenuBar,
-    QFileDialog, QInputDialog, QDialog, QComboBox, QMessageBox
+    QLineEdit, QTableWidget, QTableView, QStackedWidget, QMenuBar,
+    QFileDialog, QInputDialog, QDialog, QComboBox, QMessageBox, QSizePolicy
 )
-from PyQt5.QtCore import QTimer
-from PyQt5.QtGui import QPixmap
+from PyQt5.QtCore import (
+    Qt, QObject, QSize, QThread, QTimer, QAbstractTableModel, QModelIndex, pyqtSignal, pyqtSlot
+)
+from PyQt5.QtGui import QImage, QPixmap
 
 from pymodbus.client.sync import ModbusSerialClient
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
+from pymodbus.bit_read_message import ReadCoilsRequest, ReadDiscreteInputsRequest
+from pymodbus.register_read_message import ReadHoldingRegistersRequest
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.figure import Figure
 
 
@@ -24,7 +29,7 @@ QMenuBar {{ background:#1B1F24; }}
 QMenuBar::item:selected {{ background:{BRAND_COLOR}; }}
 QMenu {{ background:#1B1F24; }}
 QPushButton {{ background:{BRAND_COLOR}; color:white; padding:8px 14px; border-radius:6px; }}
-QLineEdit,QTableWidget {{ background:#1B1F24; border:1px solid #333; }}
+QLineEdit,QTableView {{ background:#1B1F24; border:1px solid #333; }}
 QHeaderView::section {{ background:#242A31; font-weight:bold; }}
 """
 
@@ -34,11 +39,29 @@ QMenuBar {{ background:white; }}
 QMenuBar::item:selected {{ background:{BRAND_COLOR}; color:white; }}
 QMenu {{ background:white; }}
 QPushButton {{ background:{BRAND_COLOR}; color:white; padding:8px 14px; border-radius:6px; }}
-QLineEdit,QTableWidget {{ background:white; border:1px solid #CCC; }}
+QLineEdit,QTableView {{ background:white; border:1px solid #CCC; }}
 QHeaderView::section {{ background:#EAEAEA; font-weight:bold; }}
 """
 
 
+# ================= RESOURCES =================
+def resource_path(name):
+    # PyInstaller --onefile unpacks bundled files under sys._MEIPASS
+    base = getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base, name)
+
+
+_LOGO_PIXMAP = None
+
+
+def logo_pixmap():
+    # Decoded and scaled once; needs a QApplication, so built on first use
+    global _LOGO_PIXMAP
+    if _LOGO_PIXMAP is None:
+        _LOGO_PIXMAP = QPixmap(resource_path("logo.png")).scaledToHeight(36, Qt.SmoothTransformation)
+    return _LOGO_PIXMAP
+
+
 # ================= CONFIG =================
 CONFIG = {
     "baudrate": 9600,
@@ -58,9 +81,32 @@ CONFIG = {
     "y_ppr": 1000
 }
 
+# Seconds to wait for a PLC reply; register/coil replies are only a few bytes
+RESPONSE_TIMEOUT = 0.05
+
+# PLC polling period of the worker thread and live plot/log flush period
+POLL_INTERVAL_MS = 100
+FLUSH_INTERVAL_MS = 50
+
+# Number of actual samples kept for the live plot
+ACT_HISTORY = 10000
+
+# Number of actual samples kept in the live log (about 2.8 h at 100 ms);
+# older rows are dropped LOG_TRIM at a time
+LOG_HISTORY = 100000
+LOG_TRIM = LOG_HISTORY // 10
+
+# Largest span of holding registers fetched in one request for X/Y encoders
+BATCH_MAX_REGS = 8
+
 PASSWORD = "1234"
 client = None
+fast_rtu = None
 connected = False
+# Serialises access to the serial port between the PLC worker and the GUI
+plc_lock = threading.Lock()
+# Prebuilt Modbus read requests, keyed by (request class, addr, count)
+_REQ_CACHE = {}
 current_project = None
 
 
@@ -72,8 +118,91 @@ def auto_port():
     return None
 
 
+def _crc16_table():
+    table = []
+    for b in range(256):
+        crc = b
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+        table.append(crc)
+    return table
+
+
+_CRC16_TABLE = _crc16_table()
+
+
+def crc16_modbus(data):
+    crc = 0xFFFF
+    for b in data:
+        crc = (crc >> 8) ^ _CRC16_TABLE[(crc ^ b) & 0xFF]
+    return crc
+
+
+def build_rtu_read_holding(unit, addr, count):
+    frame = struct.pack(">BBHH", unit, 0x03, addr, count)
+    return frame + struct.pack("<H", crc16_modbus(frame))
+
+
+class FastRtu:
+    """Holding-register reads framed by hand on the client's serial port.
+
+    The reply to a read of `count` registers is always 5 + 2*count bytes,
+    so it is read by size instead of waiting for the line to go quiet.
+    A Modbus exception reply returns REJECTED, since pymodbus would get
+    the same answer; any short or malformed reply returns None and the
+    caller falls back to pymodbus.
+    """
+
+    REJECTED = object()
+
+    def __init__(self, client):
+        self.client = client
+        self._frames = {}
+        self._frame_end = 0.0
+
+    def read_holding(self, addr, count):
+        port = self.client.socket
+        if port is None:
+            return None
+
+        key = (addr, count)
+        req = self._frames.get(key)
+        if req is None:
+            req = self._frames[key] = build_rtu_read_holding(1, addr, count)
+        size = 5 + 2 * count
+
+        # Keep the RTU inter-frame silence after our own or pymodbus frames
+        last = max(self._frame_end, self.client.last_frame_end or 0.0)
+        wait = last + self.client.silent_interval - time.time()
+        if wait > 0:
+            time.sleep(wait)
+
+        try:
+            port.reset_input_buffer()
+            port.write(req)
+            # unit, function, byte count (or exception code)
+            resp = port.read(3)
+            if len(resp) == 3 and resp[1] & 0x80:
+                # Exception replies are 5 bytes; drain the CRC and stop
+                resp += port.read(2)
+                if len(resp) == 5 and crc16_modbus(resp[:3]) == struct.unpack("<H", resp[3:])[0]:
+                    return self.REJECTED
+                return None
+            if len(resp) == 3:
+                resp += port.read(size - 3)
+        except serial.SerialException:
+            return None
+        finally:
+            self._frame_end = self.client.last_frame_end = time.time()
+
+        if (len(resp) != size or resp[0] != 1 or resp[1] != 0x03 or resp[2] != 2 * count
+                or crc16_modbus(resp[:-2]) != struct.unpack("<H", resp[-2:])[0]):
+            return None
+        return struct.unpack(">%dH" % count, resp[3:-2])
+
+
 def connect_plc():
-    global client, connected
+    global client, fast_rtu, connected
     port = auto_port()
     if not port:
         connected = False
@@ -86,9 +215,22 @@ def connect_plc():
         parity="E",
         stopbits=1,
         bytesize=8,
-        timeout=1
+        timeout=RESPONSE_TIMEOUT
     )
     connected = client.connect()
+    _REQ_CACHE.clear()
+
+    fast_rtu = FastRtu(client) if connected else None
+
+
+def execute_cached(kind, addr, count):
+    # Read requests are built once per (kind, addr, count) and re-sent;
+    # pymodbus assigns a fresh transaction id on every execute().
+    key = (kind, addr, count)
+    req = _REQ_CACHE.get(key)
+    if req is None:
+        req = _REQ_CACHE[key] = kind(addr, count, unit=1)
+    return client.execute(req)
 
 
 def read_plc(reg):
@@ -97,24 +239,118 @@ def read_plc(reg):
 
     t, a = reg["type"], reg["addr"]
 
-    if t in ["D", "C", "T"]:
-        r = client.read_holding_registers(a, 1, unit=1)
-        return r.registers[0] if not r.isError() else None
+    with plc_lock:
+        if t in ["D", "C", "T"]:
+            r = execute_cached(ReadHoldingRegistersRequest, a, 1)
+            return r.registers[0] if not r.isError() else None
 
-    if t in ["M", "Y"]:
-        r = client.read_coils(a, 1, unit=1)
-        return r.bits[0] if not r.isError() else None
+        if t in ["M", "Y"]:
+            r = execute_cached(ReadCoilsRequest, a, 1)
+            return r.bits[0] if not r.isError() else None
 
-    if t == "X":
-        r = client.read_discrete_inputs(a, 1, unit=1)
-        return r.bits[0] if not r.isError() else None
+        if t == "X":
+            r = execute_cached(ReadDiscreteInputsRequest, a, 1)
+            return r.bits[0] if not r.isError() else None
 
     return None
 
 
+def read_plc_batch(base_reg, count):
+    if not connected:
+        return None
+
+    with plc_lock:
+        regs = fast_rtu.read_holding(base_reg["addr"], count) if fast_rtu else None
+        if regs is FastRtu.REJECTED:
+            return None
+        if regs is not None:
+            return regs
+        r = execute_cached(ReadHoldingRegistersRequest, base_reg["addr"], count)
+    return r.registers if not r.isError() else None
+
+
 def write_plc_bit(reg):
     if connected and reg["type"] in ["M", "Y"]:
-        client.write_coil(reg["addr"], True, unit=1)
+        with plc_lock:
+            client.write_coil(reg["addr"], True, unit=1)
+
+
+# pyarrow is optional; Feather profiles are only offered when it is installed
+HAVE_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+def load_profile_csv(path):
+    # pyarrow parses with multiple threads; it is optional, and any file it
+    # cannot read as two numeric columns goes through the plain reader, so
+    # both paths load the same profile.
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pac
+    except ImportError:
+        return _load_profile_csv_plain(path)
+
+    try:
+        tbl = pac.read_csv(path, read_options=pac.ReadOptions(use_threads=True))
+    except pa.ArrowInvalid:
+        return _load_profile_csv_plain(path)
+    if not _has_numeric_profile(tbl):
+        return _load_profile_csv_plain(path)
+    return _profile_columns(tbl)
+
+
+def _has_numeric_profile(tbl):
+    import pyarrow.types as pat
+
+    return tbl.num_columns >= 2 and all(
+        pat.is_integer(tbl.column(i).type) or pat.is_floating(tbl.column(i).type)
+        for i in (0, 1)
+    )
+
+
+def _profile_columns(tbl):
+    # Empty cells become NaN and those rows are dropped, as the plain reader does
+    import pyarrow as pa
+
+    rx = tbl.column(0).cast(pa.float64()).to_numpy()
+    ry = tbl.column(1).cast(pa.float64()).to_numpy()
+    keep = ~(np.isnan(rx) | np.isnan(ry))
+    return rx[keep], ry[keep]
+
+
+def _load_profile_csv_plain(path):
+    # Plain csv is plenty for two float columns and avoids building a DataFrame
+    rx, ry = [], []
+    with open(path, newline="") as f:
+        r = csv.reader(f)
+        next(r, None)
+        for row in r:
+            if len(row) >= 2:
+                try:
+                    x, y = float(row[0]), float(row[1])
+                except ValueError:
+                    continue
+                if x != x or y != y:
+                    continue
+                rx.append(x)
+                ry.append(y)
+    return rx, ry
+
+
+def load_profile_feather(path):
+    # Raises ImportError without pyarrow; callers report it to the user
+    import pyarrow.feather as paf
+
+    tbl = paf.read_table(path)
+    if not _has_numeric_profile(tbl):
+        raise ValueError("the first two columns must be numeric")
+    return _profile_columns(tbl)
+
+
+def save_profile_csv(path, rx, ry):
+    with open(path, "w", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(["Reference_X", "Reference_Y"])
+        w.writerows(zip(rx, ry))
 
 
 def check_password():
@@ -174,7 +410,7 @@ class CreateProfileDialog(QDialog):
             return
         path, _ = QFileDialog.getSaveFileName(self, "Save CSV", "", "CSV (*.csv)")
         if path:
-            pd.DataFrame({"Reference_X": rx, "Reference_Y": ry}).to_csv(path, index=False)
+            save_profile_csv(path, rx, ry)
             QMessageBox.information(self, "Saved", "Profile saved successfully")
 
 
@@ -234,21 +470,32 @@ class MainWindow(QWidget):
             self.live.set_reference(rx, ry)
 
     def open_file(self):
-        path, _ = QFileDialog.getOpenFileName(
-            self, "Open File", "", "CSV (*.csv);;Project (*.json)"
-        )
+        filters = "CSV (*.csv);;Feather (*.feather);;Project (*.json)" if HAVE_PYARROW \
+            else "CSV (*.csv);;Project (*.json)"
+        path, _ = QFileDialog.getOpenFileName(self, "Open File", "", filters)
+        # Errors must not escape the slot: PyQt5 aborts the app on them
         if path.endswith(".csv"):
-            df = pd.read_csv(path)
-            self.live.set_reference(df.iloc[:, 0].tolist(), df.iloc[:, 1].tolist())
+            try:
+                self.live.set_reference(*load_profile_csv(path))
+            except (ValueError, OSError) as e:
+                QMessageBox.warning(self, "Open", f"Could not read profile:\n{e}")
+        elif path.endswith(".feather"):
+            try:
+                self.live.set_reference(*load_profile_feather(path))
+            except ImportError:
+                QMessageBox.warning(self, "Feather", "Opening Feather profiles requires pyarrow")
+            except (ValueError, IndexError, OSError) as e:
+                QMessageBox.warning(self, "Open", f"Could not read profile:\n{e}")
         elif path.endswith(".json"):
             with open(path, "r") as f:
                 CONFIG.update(json.load(f))
+            self.live._reload_config()
 
     def save_project(self):
         global current_project
         if current_project:
             with open(current_project, "w") as f:
-                json.dump(CONFIG, f, indent=4)
+                json.dump(CONFIG, f, separators=(",", ":"))
         else:
             self.saveas_project()
 
@@ -258,7 +505,7 @@ class MainWindow(QWidget):
         if path:
             current_project = path
             with open(path, "w") as f:
-                json.dump(CONFIG, f, indent=4)
+                json.dump(CONFIG, f, separators=(",", ":"))
 
     def goto_settings(self):
         if check_password():
@@ -269,36 +516,246 @@ class MainWindow(QWidget):
             self.stack.setCurrentIndex(2)
 
 
+# ================= PLC WORKER =================
+class PlcWorker(QObject):
+    """Polls the PLC from its own thread and emits scaled X/Y samples."""
+
+    sample = pyqtSignal(float, float, bool)
+    # Emitted after the last poll; queued behind every sample sent before it
+    stopped = pyqtSignal()
+
+    def __init__(self):
+        super().__init__()
+        # Parented to the worker so it follows it into the PLC thread
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.poll)
+
+    @pyqtSlot(object)
+    def configure(self, cfg):
+        # Plain values bound once, so poll() never looks anything up in CONFIG
+        self._x_reg, self._y_reg, self._run_reg, self._x_inv_ppr, self._y_inv_ppr = cfg
+
+        # X/Y encoders sitting close together in the holding-register space
+        # are fetched with one Modbus transaction instead of two.
+        self._batch = None
+
+        xa, ya = self._x_reg["addr"], self._y_reg["addr"]
+        if self._x_reg["type"] in ["D", "C", "T"] and self._y_reg["type"] in ["D", "C", "T"]:
+            lo = min(xa, ya)
+            count = abs(ya - xa) + 1
+            if count <= BATCH_MAX_REGS:
+                self._batch = ({"type": "D", "addr": lo}, count, xa - lo, ya - lo)
+
+    @pyqtSlot(int)
+    def start(self, interval):
+        self.timer.start(interval)
+
+    @pyqtSlot()
+    def stop(self):
+        self.timer.stop()
+        self.stopped.emit()
+
+    @pyqtSlot()
+    def poll(self):
+        if self._batch:
+            base, count, xi, yi = self._batch
+            regs = read_plc_batch(base, count)
+            xr, yr = (regs[xi], regs[yi]) if regs else (None, None)
+        else:
+            xr = read_plc(self._x_reg)
+            yr = read_plc(self._y_reg)
+        run = read_plc(self._run_reg)
+
+        if xr is None or yr is None:
+            return
+
+        self.sample.emit(xr * self._x_inv_ppr, yr * self._y_inv_ppr, bool(run))
+
+
+# ================= LOG MODEL =================
+class LogModel(QAbstractTableModel):
+    """Reference/actual log backed by numpy arrays; only visible cells are formatted.
+
+    Only the newest LOG_HISTORY actual samples are kept; older rows are
+    dropped from the top in chunks. `first` is the sample index shown in
+    row 0, so reference point i still lines up with actual sample i.
+    """
+
+    HEADERS = ["Ref X", "Ref Y", "Actual X", "Actual Y", "Diff X", "Diff Y"]
+
+    def __init__(self):
+        super().__init__()
+        # One float row per log row; missing values are NaN so diffs are a
+        # plain subtraction and NaN only becomes "" when a cell is shown.
+        self.cells = np.full((1024, 6), np.nan, np.float64)
+        self.n_ref = 0
+        self.n_act = 0
+        self.first = 0
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else max(self.n_ref, self.n_act) - self.first
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 6
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole:
+            if orientation == Qt.Horizontal:
+                return self.HEADERS[section]
+            return str(self.first + section + 1)
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+
+        v = self.cells[index.row(), index.column()]
+        return "" if v != v else f"{v:.4f}"
+
+    def _reserve(self, rows):
+        # Grown by doubling so appends stay amortised O(1)
+        cap = len(self.cells)
+        if rows > cap:
+            grown = np.full((max(rows, 2 * cap), 6), np.nan, np.float64)
+            grown[:cap] = self.cells
+            self.cells = grown
+
+    def _trim(self):
+        drop = self.n_act - self.first - LOG_HISTORY
+        if drop < LOG_TRIM:
+            return
+
+        rows = self.rowCount()
+        self.beginRemoveRows(QModelIndex(), 0, drop - 1)
+        c = self.cells
+        c[:rows - drop] = c[drop:rows]
+        c[rows - drop:rows] = np.nan
+        self.first += drop
+        self.endRemoveRows()
+
+    def set_reference(self, rx, ry):
+        self.beginResetModel()
+        n_ref = len(rx)
+        first = self.first
+        rows = max(n_ref, self.n_act) - first
+        self._reserve(rows)
+
+        c = self.cells
+        c[:, 0:2] = np.nan
+        if n_ref > first:
+            c[:n_ref - first, 0] = rx[first:]
+            c[:n_ref - first, 1] = ry[first:]
+        c[:rows, 4:6] = c[:rows, 2:4] - c[:rows, 0:2]
+        self.n_ref = n_ref
+        self.endResetModel()
+
+    def extend_act(self, xs, ys):
+        # One insert/change notification per batch rather than per sample
+        start = self.n_act - self.first
+        end = start + len(xs)
+        if end == start:
+            return
+        self._reserve(end)
+
+        rows = self.rowCount()
+        c = self.cells[start:end]
+        c[:, 2] = xs
+        c[:, 3] = ys
+        c[:, 4:6] = c[:, 2:4] - c[:, 0:2]
+
+        if end > rows:
+            self.beginInsertRows(QModelIndex(), rows, end - 1)
+        self.n_act += end - start
+        if end > rows:
+            self.endInsertRows()
+        if start < rows:
+            self.dataChanged.emit(self.index(start, 2), self.index(min(end, rows) - 1, 5))
+        self._trim()
+
+
+# ================= PLOT VIEW =================
+class PlotView(QLabel):
+    """Shows the off-screen matplotlib buffer and reports size changes."""
+
+    resized = pyqtSignal()
+
+    def __init__(self):
+        super().__init__()
+        # Same policy as FigureCanvasQT, so the plot/table split is unchanged
+        self.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+
+    # Fixed hints: QLabel would otherwise report the pixmap size, which
+    # follows every resize and would pin the figure to its last size.
+    def sizeHint(self):
+        return QSize(640, 480)
+
+    def minimumSizeHint(self):
+        return QSize(10, 10)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.resized.emit()
+
+
 # ================= LIVE PAGE =================
 class LivePage(QWidget):
+    start_polling = pyqtSignal(int)
+    stop_polling = pyqtSignal()
+    config_changed = pyqtSignal(object)
+
     def __init__(self):
         super().__init__()
 
-        self.ref_x, self.ref_y = [], []
-        self.act_x, self.act_y = [], []
-
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.read_plc)
+        self.ref_x = self.ref_y = np.empty(0, np.float64)
+
+        # Actual samples live in fixed-size ring buffers so memory stays
+        # bounded on long runs; act_x/act_y expose them oldest-first.
+        self._cap = ACT_HISTORY
+        self._ax_buf = np.empty(self._cap, np.float64)
+        self._ay_buf = np.empty_like(self._ax_buf)
+        self._n = 0
+
+        # Modbus I/O blocks, so it runs in a worker thread; the GUI only
+        # ever touches widgets from on_sample in the main thread.
+        self.plc_thread = QThread(self)
+        self.worker = PlcWorker()
+        self.worker.moveToThread(self.plc_thread)
+        self.worker.sample.connect(self.on_sample)
+        self.worker.stopped.connect(self._flush)
+        self.start_polling.connect(self.worker.start)
+        self.stop_polling.connect(self.worker.stop)
+        self.config_changed.connect(self.worker.configure)
+        self.plc_thread.start()
+        self._reload_config()
+
+        # Samples only mark the page dirty; plot and log are flushed at a
+        # capped rate however fast the PLC is polled, and only while polling.
+        self._dirty = False
+        self._logged = 0
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(False)
+        self._flush_timer.timeout.connect(self._flush)
 
         self.logo = QLabel()
-        self.logo.setPixmap(QPixmap(resource_path("logo.png")).scaledToHeight(36))
-
+        self.logo.setPixmap(logo_pixmap())
 
         self.run = QLabel("● RUN OFF")
         self.run.setStyleSheet("color:gray;font-weight:bold")
 
+        # Blinks only while RUN is on; started/stopped on RUN edges
         self.blink = False
+        self._running = False
         self.blink_timer = QTimer(self)
         self.blink_timer.timeout.connect(self.animate_run)
-        self.blink_timer.start(500)
 
         self.xv = QLabel("X: -")
         self.yv = QLabel("Y: -")
+        self._last_ax = self._last_ay = None
 
         start = QPushButton("START")
         stop = QPushButton("STOP")
-        start.clicked.connect(lambda: self.timer.start(100))
-        stop.clicked.connect(self.timer.stop)
+        start.clicked.connect(self.start)
+        stop.clicked.connect(self.stop)
 
         header = QHBoxLayout()
         header.addWidget(self.logo)
@@ -310,82 +767,198 @@ class LivePage(QWidget):
         header.addWidget(self.yv)
 
         self.fig = Figure()
-        self.canvas = FigureCanvasQTAgg(self.fig)
+        # Rendered off-screen and copied into a QLabel on our own cadence,
+        # so matplotlib never schedules Qt paint events itself.
+        self.canvas = FigureCanvasAgg(self.fig)
+        self.view = PlotView()
+        self.view.resized.connect(self._on_resize)
         self.ax = self.fig.add_subplot(111)
 
-        self.table = QTableWidget(0, 6)
-        self.table.setHorizontalHeaderLabels(
-            ["Ref X", "Ref Y", "Actual X", "Actual Y", "Diff X", "Diff Y"]
-        )
+        # Persistent artists: the actual trace is animated and blitted over
+        # a cached background so a new sample never triggers a full redraw.
+        self.ref_line, = self.ax.plot([], [], "g--", linewidth=2, label="Reference")
+        self.act_line, = self.ax.plot([], [], "b", linewidth=2, label="Actual", animated=True)
+        # Newest samples only, drawn on top of what is already on the canvas
+        self.tail_line, = self.ax.plot([], [], "b", linewidth=2, animated=True)
+        self.ax.legend()
+        self.ax.grid(True)
+        self.bg = None
+        self._drawn = 0
+        self.canvas.mpl_connect("draw_event", self.on_draw)
+
+        self.model = LogModel()
+        self.table = QTableView()
+        self.table.setModel(self.model)
 
         layout = QVBoxLayout(self)
         layout.addLayout(header)
-        layout.addWidget(self.canvas)
+        layout.addWidget(self.view)
         layout.addWidget(self.table)
 
     def set_reference(self, rx, ry):
-        self.ref_x = list(rx)
-        self.ref_y = list(ry)
-        self.update_plot()
-        self.update_table()
+        # Converted once here; the reference line is static between calls
+        self.ref_x = np.asarray(rx, dtype=np.float64)
+        self.ref_y = np.asarray(ry, dtype=np.float64)
+        self.ref_line.set_data(self.ref_x, self.ref_y)
+        self.ax.relim()
+        self.ax.autoscale_view()
+        # on_draw re-captures the blit background for the new limits
+        self._redraw()
+        self.model.set_reference(self.ref_x, self.ref_y)
 
     def animate_run(self):
-        if "ON" in self.run.text():
-            self.blink = not self.blink
-            self.run.setStyleSheet(
-                f"color:{'#00FF6A' if self.blink else '#008F3A'};font-weight:bold"
-            )
-
-    def read_plc(self):
-        xr = read_plc(CONFIG["x_encoder"])
-        yr = read_plc(CONFIG["y_encoder"])
-        run = read_plc(CONFIG["run_bit"])
+        self.blink = not self.blink
+        self.run.setStyleSheet(
+            f"color:{'#00FF6A' if self.blink else '#008F3A'};font-weight:bold"
+        )
 
-        if xr is None or yr is None:
+    @property
+    def act_x(self):
+        return self._ring_view(self._ax_buf)
+
+    @property
+    def act_y(self):
+        return self._ring_view(self._ay_buf)
+
+    def _ring_view(self, buf):
+        if self._n <= self._cap:
+            return buf[:self._n]
+        i = self._n % self._cap
+        return np.concatenate((buf[i:], buf[:i]))
+
+    def on_sample(self, ax, ay, run):
+        i = self._n % self._cap
+        self._ax_buf[i] = ax
+        self._ay_buf[i] = ay
+        self._n += 1
+
+        # Qt repaints on every setText, even with identical text
+        if ax != self._last_ax:
+            self._last_ax = ax
+            self.xv.setText("X: %.3f" % ax)
+        if ay != self._last_ay:
+            self._last_ay = ay
+            self.yv.setText("Y: %.3f" % ay)
+
+        if run != self._running:
+            self._running = run
+            self.run.setText("● RUN ON" if run else "● RUN OFF")
+            if run:
+                self.blink_timer.start(500)
+            else:
+                self.blink_timer.stop()
+                self.run.setStyleSheet("color:gray;font-weight:bold")
+
+        self._dirty = True
+
+    def start(self):
+        self._flush_timer.start(FLUSH_INTERVAL_MS)
+        self.start_polling.emit(POLL_INTERVAL_MS)
+
+    def stop(self):
+        self.stop_polling.emit()
+        # The worker's stopped signal flushes whatever it sent before stopping
+        self._flush_timer.stop()
+
+    def _flush(self):
+        if not self._dirty:
             return
 
-        ax = xr / CONFIG["x_ppr"]
-        ay = yr / CONFIG["y_ppr"]
-
-        self.act_x.append(ax)
-        self.act_y.append(ay)
-
-        self.xv.setText(f"X: {ax:.3f}")
-        self.yv.setText(f"Y: {ay:.3f}")
-        self.run.setText("● RUN ON" if run else "● RUN OFF")
-
-        self.update_plot()
-        self.update_table()
+        # The log model is cheap to feed and a hidden view does not paint;
+        # the plot is skipped until the page is shown again.
+        self._append_actual_rows()
+        if self.isVisible():
+            self.update_plot()
+        self._dirty = False
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Catch up on samples that arrived while another page was shown;
+        # they were never checked against the view, so rescale first.
+        if self._n != self._drawn:
+            self.act_line.set_data(self.act_x, self.act_y)
+            self.ax.relim()
+            self.ax.autoscale_view()
+        self._redraw()
+
+    def _append_actual_rows(self):
+        # Samples already overwritten in the ring are logged as empty rows
+        # so the log keeps one row per sample index.
+        start = max(self._logged, self._n - self._cap)
+        lost = np.full(start - self._logged, np.nan, np.float64)
+        k = np.arange(start, self._n) % self._cap
+        self.table.setUpdatesEnabled(False)
+        self.model.extend_act(
+            np.concatenate((lost, self._ax_buf[k])), np.concatenate((lost, self._ay_buf[k]))
+        )
+        self.table.setUpdatesEnabled(True)
+        self._logged = self._n
+
+    def _reload_config(self):
+        # Hands the worker a snapshot; queued, so it applies between polls
+        self.config_changed.emit((
+            dict(CONFIG["x_encoder"]),
+            dict(CONFIG["y_encoder"]),
+            dict(CONFIG["run_bit"]),
+            1.0 / CONFIG["x_ppr"],
+            1.0 / CONFIG["y_ppr"],
+        ))
+
+    def shutdown(self):
+        self.stop_polling.emit()
+        self.plc_thread.quit()
+        self.plc_thread.wait()
+
+    def on_draw(self, event):
+        # Full redraws (first show, resize, rescale) refresh the background
+        self.bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.act_line.set_data(self.act_x, self.act_y)
+        self.ax.draw_artist(self.act_line)
+        self._drawn = self._n
 
     def update_plot(self):
-        self.ax.clear()
-        if self.ref_x:
-            self.ax.plot(self.ref_x, self.ref_y, "g--", linewidth=2, label="Reference")
-        if self.act_x:
-            self.ax.plot(self.act_x, self.act_y, "b", linewidth=2, label="Actual")
-        self.ax.legend()
-        self.ax.grid(True)
-        self.canvas.draw_idle()
+        n = self._n
+        if n == self._drawn:
+            return
+
+        # New segment, starting at the last point already on the canvas
+        k = np.arange(max(self._drawn - 1, 0), n) % self._cap
+        seg_x, seg_y = self._ax_buf[k], self._ay_buf[k]
+
+        vl = self.ax.viewLim
+        if (self.bg is None
+                or seg_x.min() < vl.xmin or seg_x.max() > vl.xmax
+                or seg_y.min() < vl.ymin or seg_y.max() > vl.ymax):
+            self.act_line.set_data(self.act_x, self.act_y)
+            self.ax.relim()
+            self.ax.autoscale_view()
+            self._redraw()
+            return
 
-    def update_table(self):
-        rows = max(len(self.ref_x), len(self.act_x))
-        self.table.setRowCount(rows)
+        if n > self._cap:
+            # The oldest samples fall off the ring, so the trace is redrawn
+            self.act_line.set_data(self.act_x, self.act_y)
+            self.canvas.restore_region(self.bg)
+            self.ax.draw_artist(self.act_line)
+        else:
+            self.tail_line.set_data(seg_x, seg_y)
+            self.ax.draw_artist(self.tail_line)
+        self._present()
+        self._drawn = n
 
-        for i in range(rows):
-            rx = self.ref_x[i] if i < len(self.ref_x) else ""
-            ry = self.ref_y[i] if i < len(self.ref_y) else ""
-            ax = self.act_x[i] if i < len(self.act_x) else ""
-            ay = self.act_y[i] if i < len(self.act_y) else ""
+    def _redraw(self):
+        self.canvas.draw()
+        self._present()
 
-            dx = ax - rx if ax != "" and rx != "" else ""
-            dy = ay - ry if ay != "" and ry != "" else ""
+    def _present(self):
+        buf = self.canvas.buffer_rgba()
+        img = QImage(buf, buf.shape[1], buf.shape[0], QImage.Format_RGBA8888)
+        self.view.setPixmap(QPixmap.fromImage(img))
 
-            self.table.setItem(i, 0, QTableWidgetItem(str(rx)))
-            self.table.setItem(i, 1, QTableWidgetItem(str(ry)))
-            self.table.setItem(i, 2, QTableWidgetItem(str(ax)))
-            self.table.setItem(i, 3, QTableWidgetItem(str(ay)))
-            self.table.setItem(i, 4, QTableWidgetItem(str(dx)))
-            self.table.setItem(i, 5, QTableWidgetItem(str(dy)))
+    def _on_resize(self):
+        dpi = self.fig.dpi
+        self.fig.set_size_inches(max(self.view.width(), 1) / dpi, max(self.view.height(), 1) / dpi)
+        self._redraw()
 
 
 # ================= SETTINGS PAGE =================
@@ -423,6 +996,7 @@ class SettingsPage(QWidget):
     def save(self):
         for k, (t, n) in self.fields.items():
             CONFIG[k] = {"type": t.currentText(), "addr": int(n.text())}
+        self.parent.live._reload_config()
         self.parent.stack.setCurrentIndex(0)
 
 
@@ -430,6 +1004,7 @@ class SettingsPage(QWidget):
 class MoreSettingsPage(QWidget):
     def __init__(self, parent):
         super().__init__()
+        self.parent = parent
         layout = QVBoxLayout(self)
 
         self.xp = QLineEdit(str(CONFIG["x_ppr"]))
@@ -455,12 +1030,14 @@ class MoreSettingsPage(QWidget):
     def save(self):
         CONFIG["x_ppr"] = int(self.xp.text())
         CONFIG["y_ppr"] = int(self.yp.text())
+        self.parent.live._reload_config()
 
 
 # ================= MAIN =================
 app = QApplication(sys.argv)
 app.setStyleSheet(DARK_THEME)
 win = MainWindow()
+app.aboutToQuit.connect(win.live.shutdown)
 win.show()
 sys.exit(app.exec_())
 